@@ -10,6 +10,7 @@ from flask import Flask, request, jsonify, send_from_directory
 from flask_cors import CORS
 from werkzeug.utils import secure_filename
 import tempfile
+import threading
 import uuid
 from ocr_tool import ERPOCRTool
 
@@ -18,22 +19,50 @@ CORS(app)
 
 # Configuration
 UPLOAD_FOLDER = os.path.join(os.path.dirname(__file__), 'uploads')
-ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'bmp', 'tiff', 'pdf'}
+FILE_TYPES = {
+    'png': 'image',
+    'jpg': 'image',
+    'jpeg': 'image',
+    'gif': 'image',
+    'bmp': 'image',
+    'tiff': 'image',
+    'pdf': 'pdf',
+}
+ALLOWED_EXTENSIONS = set(FILE_TYPES)
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
 # Initialize OCR engines
 ocr_engines = {}
+ocr_engine_locks = {}
+ocr_engine_locks_guard = threading.Lock()
 
 def get_ocr_engine(lang='en'):
     """Get or create OCR engine for specified language."""
-    if lang not in ocr_engines:
-        print(f"Initializing OCR engine for language: {lang}")
-        ocr_engines[lang] = ERPOCRTool(lang=lang)
-    return ocr_engines[lang]
-
-def allowed_file(filename):
-    """Check if file extension is allowed."""
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    # Fast path: engines are only ever added, so a plain dict read is safe
+    engine = ocr_engines.get(lang)
+    if engine is None:
+        # One lock per language: concurrent first requests build one engine,
+        # and building one language never blocks requests for another
+        with ocr_engine_locks_guard:
+            lang_lock = ocr_engine_locks.setdefault(lang, threading.Lock())
+        with lang_lock:
+            engine = ocr_engines.get(lang)
+            if engine is None:
+                print(f"Initializing OCR engine for language: {lang}")
+                engine = ocr_engines[lang] = ERPOCRTool(lang=lang)
+    return engine
+
+def get_file_type(filename):
+    """Return 'image' or 'pdf' for an allowed filename, None otherwise."""
+    ext = os.path.splitext(filename)[1][1:].lower()
+    return FILE_TYPES.get(ext)
+
+def remove_upload(filepath):
+    """Delete a temporary upload, ignoring files that are already gone."""
+    try:
+        os.remove(filepath)
+    except FileNotFoundError:
+        pass
 
 @app.route('/')
 def serve():
@@ -80,7 +109,8 @@ def process_ocr():
                 'error': 'No file selected'
             }), 400
 
-        if not allowed_file(file.filename):
+        file_type = get_file_type(file.filename)
+        if file_type is None:
             return jsonify({
                 'success': False,
                 'error': f'File type not allowed. Supported: {", ".join(ALLOWED_EXTENSIONS)}'
@@ -102,27 +132,20 @@ def process_ocr():
             ocr = get_ocr_engine(lang)
 
             # Process based on file type
-            ext = filename.rsplit('.', 1)[1].lower()
-
-            if ext == 'pdf':
+            if file_type == 'pdf':
                 result = ocr.process_pdf(filepath)
             else:
                 result = ocr.process_image(filepath)
 
-            # Clean up
-            os.remove(filepath)
-
             return jsonify({
                 'success': True,
                 'data': result,
                 'language': lang
             })
 
-        except Exception as e:
-            # Clean up on error
-            if os.path.exists(filepath):
-                os.remove(filepath)
-            raise e
+        finally:
+            # Clean up
+            remove_upload(filepath)
 
     except Exception as e:
         return jsonify({
@@ -159,7 +182,8 @@ def process_ocr_text_only():
                 'error': 'No file selected'
             }), 400
 
-        if not allowed_file(file.filename):
+        file_type = get_file_type(file.filename)
+        if file_type is None:
             return jsonify({
                 'success': False,
                 'error': f'File type not allowed. Supported: {", ".join(ALLOWED_EXTENSIONS)}'
@@ -177,7 +201,6 @@ def process_ocr_text_only():
         try:
             ocr = get_ocr_engine(lang)
             text = ocr.get_text_only(filepath)
-            os.remove(filepath)
 
             return jsonify({
                 'success': True,
@@ -185,10 +208,8 @@ def process_ocr_text_only():
                 'language': lang
             })
 
-        except Exception as e:
-            if os.path.exists(filepath):
-                os.remove(filepath)
-            raise e
+        finally:
+            remove_upload(filepath)
 
     except Exception as e:
         return jsonify({
@@ -10,7 +10,6 @@ os.environ['DISABLE_MODEL_SOURCE_CHECK'] = 'True'
 import json
 from paddleocr import PaddleOCR
 import fitz  # PyMuPDF for PDF handling
-from PIL import Image
 import cv2
 import numpy as np
 
@@ -99,20 +98,26 @@ class ERPOCRTool:
 
             extracted_data['processed_pages'] = pages_to_process
 
+            # Zoom matrices are the same for every page
+            zoom_2x = fitz.Matrix(2, 2)
+            zoom_1x = fitz.Matrix(1, 1)
+
             for page_num in range(pages_to_process):
                 page = pdf[page_num]
 
-                # Convert page to image (2x scale for better OCR)
-                mat = fitz.Matrix(2, 2)
-                pm = page.get_pixmap(matrix=mat, alpha=False)
-
-                # If too large, use 1x scale
-                if pm.width > 2000 or pm.height > 2000:
-                    pm = page.get_pixmap(matrix=fitz.Matrix(1, 1), alpha=False)
+                # Convert page to image (2x scale for better OCR).
+                # If too large, use 1x scale - decided from the rounded 2x
+                # pixel size so oversized pages are not rendered twice.
+                irect = (page.rect * zoom_2x).irect
+                if irect.width > 2000 or irect.height > 2000:
+                    pm = page.get_pixmap(matrix=zoom_1x, alpha=False)
+                else:
+                    pm = page.get_pixmap(matrix=zoom_2x, alpha=False)
 
-                # Convert to numpy array for OCR
-                img = Image.frombytes("RGB", [pm.width, pm.height], pm.samples)
-                img_array = cv2.cvtColor(np.array(img), cv2.COLOR_RGB2BGR)
+                # View the pixmap buffer as a numpy array without copying
+                # (pm.samples would copy it into a new bytes object)
+                img = np.frombuffer(pm.samples_mv, dtype=np.uint8).reshape(pm.height, pm.width, pm.n)
+                img_array = cv2.cvtColor(img, cv2.COLOR_RGB2BGR)
 
                 # Run OCR on the image
                 result = self.ocr.predict(img_array)
@@ -224,8 +229,10 @@ class ERPOCRTool:
 
     def save_results_json(self, result: dict, output_path: str):
         """Save OCR results to a JSON file."""
+        # Serialize in memory and write once; json.dump issues a write per token
+        data = json.dumps(result, indent=2, ensure_ascii=False)
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+            f.write(data)
 
 
 def main():